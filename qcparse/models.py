@@ -3,7 +3,7 @@
 from collections import defaultdict
 from enum import Enum
 from types import SimpleNamespace
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, FrozenSet, List, Optional
 
 from pydantic import BaseModel, model_validator
 from qcio import CalcType
@@ -26,7 +26,7 @@ class ParserSpec(BaseModel):
     parser: Callable
     filetype: str
     required: bool
-    calctypes: List[CalcType]
+    calctypes: FrozenSet[CalcType]
 
 
 class ParserRegistry(BaseModel):
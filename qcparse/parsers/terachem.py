@@ -1,29 +1,47 @@
 """Parsers for TeraChem output files."""
 
+import math
 import re
 
+import numpy as np
 from qcio import CalcType
 
-from qcparse.exceptions import MatchNotFoundError
+from qcparse.exceptions import MatchNotFoundError, ParserError
 from qcparse.models import FileType, ParsedDataCollector
 
 from .utils import parser, regex_search
 
 SUPPORTED_FILETYPES = {FileType.stdout}
 
+# Regex patterns compiled once at import time rather than on every parser call
+# One capture group per calctype header so match.lastindex identifies the hit
+_CALCTYPE_RE = re.compile(
+    r"(SINGLE POINT ENERGY CALCULATIONS)"
+    r"|(SINGLE POINT GRADIENT CALCULATIONS)"
+    r"|(FREQUENCY ANALYSIS)"
+)
+_CALCTYPES = (CalcType.energy, CalcType.gradient, CalcType.hessian)
+_ENERGY_RE = re.compile(r"FINAL ENERGY: (-?\d+(?:\.\d+)?)")
+_GRADIENT_HEADER = f"dE/dX{' ' * 12}dE/dY{' ' * 12}dE/dZ\n"
+# A gradient block may only contain numeric characters up to the terminating ----
+_GRADIENT_BLOCK_RE = re.compile(r"[\d\.\-\s]+")
+_HESSIAN_HEADER = "*** Hessian Matrix (Hartree/Bohr^2) ***"
+_HESSIAN_FLOAT_RE = re.compile(r"-?\d\.\d{15}e[+-]\d{2}")
+# TeraChem prints the Hessian matrix in blocks of six columns
+_HESSIAN_COLUMNS = 6
+_NATOMS_RE = re.compile(r"Total atoms:\s*(\d+)")
+_NMO_RE = re.compile(r"Total orbitals:\s*(\d+)")
+_VERSION_CONTROL_RE = re.compile(r"(Git|Hg) Version: (\S*)")
+_TERACHEM_VERSION_RE = re.compile(r"TeraChem (v\S*)")
+
 
 def parse_calctype(string: str) -> CalcType:
-    """Parse the calctype from TeraChem stdout."""
-    calctypes = {
-        r"SINGLE POINT ENERGY CALCULATIONS": CalcType.energy,
-        r"SINGLE POINT GRADIENT CALCULATIONS": CalcType.gradient,
-        r"FREQUENCY ANALYSIS": CalcType.hessian,
-    }
-    for regex, calctype in calctypes.items():
-        match = re.search(regex, string)
-        if match:
-            return calctype
-    raise MatchNotFoundError(regex, string)
+    """Parse the calctype from TeraChem stdout.
+
+    All calctype headers are matched in a single pass over the string.
+    """
+    match = regex_search(_CALCTYPE_RE, string)
+    return _CALCTYPES[match.lastindex - 1]
 
 
 @parser()
@@ -34,27 +52,30 @@ def parse_energy(string: str, data_collector: ParsedDataCollector):
         - Works on frequency files containing many energy values because re.search()
             returns the first result
     """
-    regex = r"FINAL ENERGY: (-?\d+(?:\.\d+)?)"
-    data_collector.energy = float(regex_search(regex, string).group(1))
+    data_collector.energy = float(regex_search(_ENERGY_RE, string).group(1))
 
 
 @parser(only=[CalcType.gradient, CalcType.hessian])
 def parse_gradient(string: str, data_collector: ParsedDataCollector):
     """Parse gradient from TeraChem stdout."""
-    # This will match all floats after the dE/dX dE/dY dE/dZ header and stop at the
-    # terminating ---- line
-    regex = r"(?<=dE\/dX\s{12}dE\/dY\s{12}dE\/dZ\n)[\d\.\-\s]+(?=\n-{2,})"
-    gradient_string = regex_search(regex, string).group()
-
-    # split string and cast to floats
-    values = [float(val) for val in gradient_string.split()]
-
-    # arrange into N x 3 gradient
-    gradient = []
-    for i in range(0, len(values), 3):
-        gradient.append(values[i : i + 3])
-
-    data_collector.gradient = gradient
+    # Locate the block between the dE/dX dE/dY dE/dZ header and the terminating ----
+    # line with str.find, then validate it with a single linear fullmatch
+    start = string.find(_GRADIENT_HEADER)
+    end = string.find("\n--", start)
+    if start == -1 or end == -1:
+        raise MatchNotFoundError(_GRADIENT_HEADER, string)
+    gradient_string = string[start + len(_GRADIENT_HEADER) : end]
+    if not _GRADIENT_BLOCK_RE.fullmatch(gradient_string):
+        raise MatchNotFoundError(_GRADIENT_BLOCK_RE.pattern, string)
+
+    # cast to floats in C and arrange into N x 3 gradient
+    values = np.fromstring(gradient_string, dtype=np.float64, sep=" ")
+    if values.size % 3:
+        raise ParserError(
+            f"Gradient should have 3 values per atom. Recovered {values.size} values."
+        )
+
+    data_collector.gradient = values.reshape(-1, 3).tolist()
 
 
 @parser(only=[CalcType.hessian])
@@ -62,64 +83,67 @@ def parse_hessian(string: str, data_collector: ParsedDataCollector):
     """Parse Hessian Matrix from TeraChem stdout
 
     Notes:
-        This function searches the entire document N times for all regex matches where
-        N is the number of atoms. This makes the function's code easy to reason about.
-        If performance becomes an issues for VERY large Hessians (unlikely) you can
-        accelerate this function by parsing all Hessian floats in one pass, like the
-        parse_gradient function above, and then doing the math to figure out how to
-        properly sequence those values to from the Hessian matrix given TeraChem's
-        six-column format for printing out Hessian matrix entries.
+        All Hessian floats are collected in a single pass over the Hessian section of
+        the document. TeraChem prints the N x N matrix as consecutive blocks of six
+        columns, each block containing all N rows, so the flat array of values is
+        reassembled into the full matrix one column block at a time.
     """
-    # requires .format(int). {{}} values are to escape {15|2} for .format()
-    regex = r"(?:\s+{}\s)((?:\s-?\d\.\d{{15}}e[+-]\d{{2}})+)"
-    hessian = []
-
-    # Match all rows containing Hessian data; one set of rows at a time
-    count = 1
-    while matches := re.findall(regex.format(count), string):
-        row = []
-        for match in matches:
-            row.extend([float(val) for val in match.split()])
-        hessian.append(row)
-        count += 1
-
-    if not hessian:
-        raise MatchNotFoundError(regex, string)
-
-    # Assert we have created a square Hessian matrix
-    for i, row in enumerate(hessian):
-        assert len(row) == len(
-            hessian
-        ), "We must have missed some floats. Hessian should be a square matrix. Only "
-        f"recovered {len(row)} of {len(hessian)} floats for row {i}."
-
-    data_collector.hessian = hessian
+    # Scope parsing to the Hessian section, terminated by two consecutive blank lines
+    start = string.find(_HESSIAN_HEADER)
+    if start == -1:
+        raise MatchNotFoundError(_HESSIAN_HEADER, string)
+    start += len(_HESSIAN_HEADER)
+    end = string.find("\n\n\n", start)
+    if end == -1:
+        raise MatchNotFoundError("\n\n\n", string)
+    block = string[start:end]
+
+    floats = _HESSIAN_FLOAT_RE.findall(block)
+    if not floats:
+        raise MatchNotFoundError(_HESSIAN_FLOAT_RE.pattern, string)
+
+    values = np.array(floats, dtype=np.float64)
+    n = math.isqrt(values.size)
+    if n * n != values.size:
+        raise ParserError(
+            "We must have missed some floats. Hessian should be a square matrix. Only "
+            f"recovered {values.size} floats which is not a perfect square."
+        )
+
+    # Full six-column blocks, then the (possibly narrower) final block
+    n_full = n // _HESSIAN_COLUMNS
+    split = n_full * n * _HESSIAN_COLUMNS
+    full = (
+        values[:split]
+        .reshape(n_full, n, _HESSIAN_COLUMNS)
+        .transpose(1, 0, 2)
+        .reshape(n, n_full * _HESSIAN_COLUMNS)
+    )
+    remainder = values[split:].reshape(n, n - n_full * _HESSIAN_COLUMNS)
+
+    data_collector.hessian = np.hstack((full, remainder)).tolist()
 
 
 @parser()
 def parse_natoms(string: str, data_collector: ParsedDataCollector):
     """Parse number of atoms value from TeraChem stdout"""
-    regex = r"Total atoms:\s*(\d+)"
-    data_collector.calcinfo_natoms = int(regex_search(regex, string).group(1))
+    data_collector.calcinfo_natoms = int(regex_search(_NATOMS_RE, string).group(1))
 
 
 @parser()
 def parse_nmo(string: str, data_collector: ParsedDataCollector):
     """Parse the number of molecular orbitals TeraChem stdout"""
-    regex = r"Total orbitals:\s*(\d+)"
-    data_collector.calcinfo_nmo = int(regex_search(regex, string).group(1))
+    data_collector.calcinfo_nmo = int(regex_search(_NMO_RE, string).group(1))
 
 
 def parse_version_control_details(string: str) -> str:
     """Parse TeraChem git commit or Hg version from TeraChem stdout."""
-    regex = r"(Git|Hg) Version: (\S*)"
-    return regex_search(regex, string).group(2)
+    return regex_search(_VERSION_CONTROL_RE, string).group(2)
 
 
 def parse_terachem_version(string: str) -> str:
     """Parse TeraChem version from TeraChem stdout."""
-    regex = r"TeraChem (v\S*)"
-    return regex_search(regex, string).group(1)
+    return regex_search(_TERACHEM_VERSION_RE, string).group(1)
 
 
 def parse_version_string(string: str) -> str:
@@ -132,8 +156,5 @@ def parse_version_string(string: str) -> str:
 
 def calculation_succeeded(string: str) -> bool:
     """Determine from TeraChem stdout if a calculation completed successfully."""
-    regex = r"Job finished:"
-    if re.search(regex, string):
-        # If any match for a failure regex is found, the calculation failed
-        return True
-    return False
+    # Fixed-string search from the end; the marker is printed at the end of a run
+    return string.rfind("Job finished:") != -1
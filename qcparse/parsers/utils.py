@@ -1,7 +1,7 @@
 import importlib
 import inspect
 import re
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from qcio import CalcType
 
@@ -46,7 +46,10 @@ def parser(
             parser=func,
             filetype=filetype,
             required=required,
-            calctypes=only or [CalcType.energy, CalcType.gradient, CalcType.hessian],
+            # frozenset for O(1) calctype membership tests when filtering parsers
+            calctypes=frozenset(
+                only or [CalcType.energy, CalcType.gradient, CalcType.hessian]
+            ),
         )
 
         # Register the function in the global registry
@@ -57,14 +60,14 @@ def parser(
     return decorator
 
 
-def regex_search(regex: str, string: str) -> re.Match:
+def regex_search(regex: Union[str, re.Pattern], string: str) -> re.Match:
     """Function for matching a regex to a string.
 
     Will match and return the first match found or raise MatchNotFoundError
     if no match is found.
 
     Args:
-        regex: A regular expression string.
+        regex: A regular expression string or a precompiled pattern.
         string: The string to match on.
 
     Returns:
@@ -73,7 +76,10 @@ def regex_search(regex: str, string: str) -> re.Match:
     Raises:
         MatchNotFoundError if no match found.
     """
-    match = re.search(regex, string)
+    if isinstance(regex, re.Pattern):
+        match = regex.search(string)
+    else:
+        match = re.search(regex, string)
     if not match:
-        raise MatchNotFoundError(regex, string)
+        raise MatchNotFoundError(getattr(regex, "pattern", regex), string)
     return match
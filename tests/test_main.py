@@ -4,12 +4,43 @@ from qcparse.encoders import terachem
 from qcparse.exceptions import EncoderError
 from qcparse.main import encode, parse
 
+from .data import gradients, hessians
+
 
 def test_main_terachem_energy(terachem_energy_stdout):
     computed_props = parse(terachem_energy_stdout, "terachem")
     assert computed_props.energy == -76.3861099088
 
 
+@pytest.mark.parametrize(
+    "filename,energy,natoms,nmo,gradient,hessian",
+    (
+        ("water.gradient.out", -76.3861099088, 3, 13, gradients.water, None),
+        ("caffeine.gradient.out", -680.1453428559, 24, 146, gradients.caffeine, None),
+        ("water.frequencies.out", -76.3861099088, 3, 13, None, hessians.water),
+        (
+            "caffeine.frequencies.out",
+            -680.1529249931,
+            24,
+            146,
+            gradients.caffeine_frequencies,
+            hessians.caffeine,
+        ),
+    ),
+)
+def test_main_terachem_parses_all_fields(
+    test_data_dir, filename, energy, natoms, nmo, gradient, hessian
+):
+    results = parse(test_data_dir / filename, "terachem")
+    assert results.energy == energy
+    assert results.calcinfo_natoms == natoms
+    assert results.calcinfo_nmo == nmo
+    if gradient is not None:
+        assert results.gradient.tolist() == gradient
+    if hessian is not None:
+        assert results.hessian.tolist() == hessian
+
+
 def test_encode_raises_error_with_invalid_calctype(prog_inp):
     prog_inp = prog_inp("optimization")  # Not currently supported by terachem encoder
     with pytest.raises(EncoderError):
@@ -2,7 +2,7 @@ import pytest
 from qcio import CalcType
 
 from qcparse.encoders.terachem import PADDING, XYZ_FILENAME, encode
-from qcparse.exceptions import EncoderError, MatchNotFoundError
+from qcparse.exceptions import EncoderError, MatchNotFoundError, ParserError
 from qcparse.parsers.terachem import (
     calculation_succeeded,
     parse_calctype,
@@ -134,6 +134,26 @@ def test_parse_gradient(test_data_dir, filename, gradient, data_collector):
     assert data_collector.gradient == gradient
 
 
+def test_parse_gradient_raises_exception(data_collector):
+    with pytest.raises(MatchNotFoundError):
+        parse_gradient("No gradient here", data_collector)
+
+
+def test_parse_gradient_raises_exception_malformed_block(data_collector):
+    tcout = (
+        f"dE/dX{' ' * 12}dE/dY{' ' * 12}dE/dZ\n"
+        "0.1 0.2 0.3\n0.4 0.5 0.6\nSome text 1 2 3\n-----"
+    )
+    with pytest.raises(MatchNotFoundError):
+        parse_gradient(tcout, data_collector)
+
+
+def test_parse_gradient_raises_exception_incomplete_row(data_collector):
+    tcout = f"dE/dX{' ' * 12}dE/dY{' ' * 12}dE/dZ\n0.1 0.2 0.3\n0.4 0.5\n-----"
+    with pytest.raises(ParserError):
+        parse_gradient(tcout, data_collector)
+
+
 @pytest.mark.parametrize(
     "filename,hessian",
     (
@@ -155,6 +175,31 @@ def test_parse_hessian(test_data_dir, filename, hessian, data_collector):
     assert data_collector.hessian == hessian
 
 
+def test_parse_hessian_raises_exception(data_collector):
+    with pytest.raises(MatchNotFoundError):
+        parse_hessian("No Hessian here", data_collector)
+
+
+def test_parse_hessian_raises_exception_truncated_block(test_data_dir, data_collector):
+    tcout = (test_data_dir / "water.frequencies.out").read_text()
+    # Drop the final row of the last column block
+    tcout = tcout.replace(
+        "   9  -2.124705394871904e-01 1.194182938517727e-01 2.709321551739474e-01\n",
+        "",
+    )
+    with pytest.raises(ParserError):
+        parse_hessian(tcout, data_collector)
+
+
+def test_parse_hessian_raises_exception_unterminated_block(
+    test_data_dir, data_collector
+):
+    tcout = (test_data_dir / "water.frequencies.out").read_text()
+    tcout = tcout[: tcout.index("Dipole moment derivatives")].rstrip() + "\n"
+    with pytest.raises(MatchNotFoundError):
+        parse_hessian(tcout, data_collector)
+
+
 @pytest.mark.parametrize(
     "filename,n_atoms",
     (("water.energy.out", 3), ("caffeine.gradient.out", 24)),